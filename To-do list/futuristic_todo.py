@@ -8,21 +8,182 @@ Version: 2.0
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+from tkinter import font as tkfont
+import functools
 import json
+import math
 import os
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
-import threading
 import time
 from typing import List, Dict, Optional
-import uuid
+
+# Streaming parser for large imports, if ijson is installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Calendar drop-down for due dates, if tkcalendar is installed
+try:
+    from tkcalendar import DateEntry
+except ImportError:
+    DateEntry = None
+
+# Use orjson for persistence when available, stdlib json otherwise
+try:
+    import orjson
+    
+    def _dumps(obj, indent=True):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj, indent=True):
+        if indent:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(',', ':')).encode()
+    _loads = json.loads
+
+# Sortable rank per priority level, stored on each task as 'priority_rank'
+PRIORITY_RANK = {'low': 0, 'medium': 1, 'high': 2, 'critical': 3}
+
+def _iter_json_array(f):
+    """Iterate the items of a JSON array file, streaming them when ijson is available"""
+    if ijson is not None:
+        return ijson.items(f, 'item', use_float=True)
+    data = _loads(f.read())
+    return data if isinstance(data, list) else []
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value):
+    """Parse an ISO timestamp, memoized since tasks are re-indexed with the same strings"""
+    return datetime.fromisoformat(value)
+
+def _date_parts(dt):
+    """Zero-padded date, hour and minute strings; f-strings skip strftime's locale handling"""
+    return f"{dt.year}-{dt.month:02d}-{dt.day:02d}", f"{dt.hour:02d}", f"{dt.minute:02d}"
+
+@dataclass(slots=True, eq=False)
+class Task:
+    """A single task; underscore-prefixed fields are render caches and never saved.
+    Tasks compare by identity, so list.remove() never compares field by field."""
+    id: str
+    text: str
+    completed: bool = False
+    priority: str = 'low'
+    due_date: Optional[str] = None
+    due_time: Optional[str] = None
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    notes: str = ''
+    completed_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    priority_rank: int = 0
+    due_ts: Optional[float] = None
+    _due_dt: Optional[datetime] = field(default=None, repr=False, compare=False)
+    _due_display: str = field(default='', repr=False, compare=False)
+    _created_display: str = field(default='', repr=False, compare=False)
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build a task from saved JSON, ignoring unknown and cache keys"""
+        return cls(**{k: v for k, v in data.items() if k in TASK_FIELDS})
+    
+    def to_dict(self):
+        """Return the saved fields of the task as a plain dict"""
+        return {name: getattr(self, name) for name in TASK_FIELDS}
+
+# Fields written to the data file, journal and exports
+TASK_FIELDS = tuple(f.name for f in fields(Task) if not f.name.startswith('_'))
+
+class TaskRow:
+    """A pooled task row, re-pointed at whichever task scrolls into its slot"""
+    __slots__ = ('frame', 'priority_colors', 'text_colors', 'item', 'task_id', 'indicator', 'text_label',
+                 'text_var', 'meta_var', 'complete_var', 'y', 'shown', 'indicator_bg', 'text_fg')
+    
+    def __init__(self, frame, priority_colors, text_colors):
+        self.frame = frame
+        self.priority_colors = priority_colors
+        self.text_colors = text_colors
+        self.item = None
+        self.task_id = None
+        self.indicator = None
+        self.text_label = None
+        self.text_var = tk.StringVar()
+        self.meta_var = tk.StringVar()
+        self.complete_var = tk.StringVar()
+        self.y = None
+        self.shown = False
+        self.indicator_bg = None
+        self.text_fg = None
+        
+    def update(self, task, now):
+        """Point the row at a task and refresh its text and colors; now is the render's time.time()"""
+        self.task_id = task.id
+        
+        # Priority color indicator, reconfigured only when it changes
+        indicator_bg = self.priority_colors.get(task.priority, self.priority_colors['low'])
+        if indicator_bg != self.indicator_bg:
+            self.indicator.configure(bg=indicator_bg)
+            self.indicator_bg = indicator_bg
+        
+        # Task text
+        task_text = task.text
+        if task.completed:
+            task_text = f"✅ {task_text}"
+        self.text_var.set(task_text)
+        text_color = self.text_colors[bool(task.completed)]
+        if text_color != self.text_fg:
+            self.text_label.configure(fg=text_color)
+            self.text_fg = text_color
+        
+        # Meta info, built as one string; date strings are formatted once per task in _precompute_fields
+        due = f" | {task._due_display}" if task._due_display else ""
+        overdue = " | ⚠️ OVERDUE" if task.due_ts is not None and task.due_ts < now and not task.completed else ""
+        self.meta_var.set(f"Priority: {task.priority.upper()}{due}{overdue} | Created: {task._created_display}")
+        
+        # Complete button
+        self.complete_var.set("✅" if not task.completed else "🔄")
 
 class FuturisticTodo:
+    # Fixed height of a task row in the virtualized list (pixels)
+    ROW_HEIGHT = 120
+    
     def __init__(self):
         self.root = tk.Tk()
-        self.tasks: List[Dict] = []
+        self.tasks: List[Task] = []
         self.current_filter = "all"
         self.search_query = ""
         self.data_file = "futuristic_todos.json"
+        self.wal_file = "futuristic_todos.wal"
+        
+        # Pending snapshot write; mutations are journaled to wal_file meanwhile
+        self._dirty = False
+        self._save_job = None
+        
+        # Recycled row widgets and the tasks they currently page through
+        self._row_pool = []
+        self._filtered = []
+        self._first_visible = None
+        
+        # Next sequential task id (older uuid ids keep working as-is)
+        self._next_id = 0
+        
+        # Task lookup by id, kept in sync with self.tasks
+        self._by_id: Dict[str, Task] = {}
+        
+        # Search/filter index: lowercased text+notes, sort keys and id sets per filter
+        self._lc_text: Dict[str, str] = {}
+        self._sort_keys: Dict[str, tuple] = {}
+        self._pending_ids = set()
+        self._completed_ids = set()
+        self._high_ids = set()
+        
+        # When _check_due last ran; only due times passed since then are announced
+        self._last_due_check = time.time()
+        
+        # Pending debounced callbacks for search typing and canvas resizing
+        self._search_job = None
+        self._configure_job = None
         
         # Theme colors (Cyberpunk style)
         self.colors = {
@@ -40,12 +201,26 @@ class FuturisticTodo:
             'border': '#333333'
         }
         
+        # Indicator color per priority and text color per completed state, shared by all task rows
+        self.priority_colors = {
+            'low': self.colors['success'],
+            'medium': self.colors['warning'],
+            'high': self.colors['error'],
+            'critical': self.colors['error']
+        }
+        self.text_colors = {False: self.colors['text_primary'], True: self.colors['text_secondary']}
+        
         self.setup_window()
+        self.create_fonts()
         self.create_styles()
         self.create_widgets()
+        self._build_edit_dialog()
         self.load_tasks()
-        self.update_stats()
         self.add_welcome_tasks_if_empty()
+        self.update_stats()
+        
+        # Overdue checks run on the Tk event loop, no background thread
+        self.root.after(60_000, self._check_due)
         
     def setup_window(self):
         """Configure the main window"""
@@ -66,6 +241,23 @@ class FuturisticTodo:
         except:
             pass
             
+    def create_fonts(self):
+        """Create shared named fonts so Tk resolves each spec only once"""
+        self.fonts = {
+            'regular9': tkfont.Font(family='Arial', size=9),
+            'regular10': tkfont.Font(family='Arial', size=10),
+            'regular11': tkfont.Font(family='Arial', size=11),
+            'regular12': tkfont.Font(family='Arial', size=12),
+            'regular14': tkfont.Font(family='Arial', size=14),
+            'bold8': tkfont.Font(family='Arial', size=8, weight='bold'),
+            'bold9': tkfont.Font(family='Arial', size=9, weight='bold'),
+            'bold10': tkfont.Font(family='Arial', size=10, weight='bold'),
+            'bold12': tkfont.Font(family='Arial', size=12, weight='bold'),
+            'bold18': tkfont.Font(family='Arial', size=18, weight='bold'),
+            'bold24': tkfont.Font(family='Arial', size=24, weight='bold'),
+            'italic10': tkfont.Font(family='Arial', size=10, slant='italic')
+        }
+        
     def create_styles(self):
         """Create custom styles for widgets"""
         self.style = ttk.Style()
@@ -87,7 +279,7 @@ class FuturisticTodo:
         self.style.configure('Cyber.TButton',
                            background=self.colors['accent_cyan'],
                            foreground=self.colors['bg_primary'],
-                           font=('Arial', 10, 'bold'),
+                           font=self.fonts['bold10'],
                            relief='flat',
                            borderwidth=0,
                            padding=(20, 10))
@@ -102,26 +294,32 @@ class FuturisticTodo:
                            foreground=self.colors['text_primary'],
                            bordercolor=self.colors['accent_cyan'],
                            insertcolor=self.colors['accent_cyan'],
-                           font=('Arial', 11))
+                           font=self.fonts['regular11'])
         
         # Label styles
         self.style.configure('Title.TLabel',
                            background=self.colors['bg_primary'],
                            foreground=self.colors['accent_cyan'],
-                           font=('Arial', 24, 'bold'))
+                           font=self.fonts['bold24'])
         
         self.style.configure('Stat.TLabel',
                            background=self.colors['bg_card'],
                            foreground=self.colors['text_primary'],
-                           font=('Arial', 12, 'bold'))
+                           font=self.fonts['bold12'])
         
         self.style.configure('StatValue.TLabel',
                            background=self.colors['bg_card'],
                            foreground=self.colors['accent_cyan'],
-                           font=('Arial', 18, 'bold'))
+                           font=self.fonts['bold18'])
         
     def create_widgets(self):
         """Create and arrange all GUI widgets"""
+        # Shared tk.Button defaults, applied by Tk instead of per-button options
+        for option, value in [('*Button.relief', 'flat'),
+                              ('*Button.borderWidth', '0'),
+                              ('*Button.font', self.fonts['bold9'])]:
+            self.root.option_add(option, value)
+            
         # Main container
         main_frame = ttk.Frame(self.root, style='Main.TFrame')
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -141,6 +339,12 @@ class FuturisticTodo:
         # Status bar
         self.create_status_bar(main_frame)
         
+    def _cyber_btn(self, parent, text, cmd, bg, fg=None, padx=15, pady=5, **options):
+        """Create a flat themed button on top of the option-database defaults"""
+        return tk.Button(parent, text=text, command=cmd, bg=bg,
+                       fg=fg or self.colors['bg_primary'],
+                       padx=padx, pady=pady, **options)
+        
     def create_header(self, parent):
         """Create the header with title and stats"""
         header_frame = ttk.Frame(parent, style='Header.TFrame')
@@ -158,7 +362,7 @@ class FuturisticTodo:
                                  text="Futuristic Task Management System",
                                  background=self.colors['bg_card'],
                                  foreground=self.colors['text_secondary'],
-                                 font=('Arial', 10, 'italic'))
+                                 font=self.fonts['italic10'])
         subtitle_label.pack()
         
         # Stats section
@@ -194,7 +398,7 @@ class FuturisticTodo:
         # Task input
         self.task_var = tk.StringVar()
         task_entry = ttk.Entry(first_row, textvariable=self.task_var, 
-                              style='Cyber.TEntry', font=('Arial', 12))
+                              style='Cyber.TEntry', font=self.fonts['regular12'])
         task_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
         task_entry.bind('<Return>', lambda e: self.add_task())
         
@@ -221,63 +425,34 @@ class FuturisticTodo:
         date_label = ttk.Label(date_frame, text="📅 Due Date:", 
                               background=self.colors['bg_primary'],
                               foreground=self.colors['accent_cyan'],
-                              font=('Arial', 10, 'bold'))
+                              font=self.fonts['bold10'])
         date_label.pack(side=tk.LEFT, padx=(0, 5))
         
         # Date selection with current date as default
-        current_date = datetime.now()
-        self.due_date_var = tk.StringVar(value=current_date.strftime("%Y-%m-%d"))
-        
-        # Date picker using dropdown menus for better UX
-        date_picker_frame = ttk.Frame(date_frame, style='Main.TFrame')
-        date_picker_frame.pack(side=tk.LEFT)
-        
-        # Year dropdown
-        self.year_var = tk.StringVar(value=str(current_date.year))
-        year_combo = ttk.Combobox(date_picker_frame, textvariable=self.year_var,
-                                values=[str(y) for y in range(current_date.year, current_date.year + 5)],
-                                state="readonly", width=6)
-        year_combo.pack(side=tk.LEFT, padx=(0, 2))
-        year_combo.bind('<<ComboboxSelected>>', self.update_date_string)
-        
-        # Month dropdown
-        months = ['01', '02', '03', '04', '05', '06', '07', '08', '09', '10', '11', '12']
-        month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        self.month_var = tk.StringVar(value=current_date.strftime("%m"))
-        month_combo = ttk.Combobox(date_picker_frame, textvariable=self.month_var,
-                                 values=months, state="readonly", width=4)
-        month_combo.pack(side=tk.LEFT, padx=(0, 2))
-        month_combo.bind('<<ComboboxSelected>>', self.update_date_string)
-        
-        # Day dropdown
-        self.day_var = tk.StringVar(value=current_date.strftime("%d"))
-        days = [f"{d:02d}" for d in range(1, 32)]
-        day_combo = ttk.Combobox(date_picker_frame, textvariable=self.day_var,
-                               values=days, state="readonly", width=4)
-        day_combo.pack(side=tk.LEFT, padx=(0, 5))
-        day_combo.bind('<<ComboboxSelected>>', self.update_date_string)
+        _, today, hour, minute = self._now_parts()
+        self.due_date_var = tk.StringVar(value=today)
+        
+        # Single date field instead of year/month/day dropdowns
+        date_picker = self._create_date_picker(date_frame, self.due_date_var)
+        date_picker.pack(side=tk.LEFT, padx=(0, 5))
         
         # Quick date buttons
         quick_date_frame = ttk.Frame(date_frame, style='Main.TFrame')
         quick_date_frame.pack(side=tk.LEFT, padx=(5, 0))
         
-        today_btn = tk.Button(quick_date_frame, text="Today",
-                            command=lambda: self.set_quick_date(0),
-                            bg=self.colors['accent_cyan'], fg=self.colors['bg_primary'],
-                            relief='flat', padx=8, pady=2, font=('Arial', 8, 'bold'))
+        today_btn = self._cyber_btn(quick_date_frame, "Today",
+                                    lambda: self.set_quick_date(0), self.colors['accent_cyan'],
+                                    padx=8, pady=2, font=self.fonts['bold8'])
         today_btn.pack(side=tk.LEFT, padx=2)
         
-        tomorrow_btn = tk.Button(quick_date_frame, text="Tomorrow",
-                               command=lambda: self.set_quick_date(1),
-                               bg=self.colors['accent_magenta'], fg=self.colors['bg_primary'],
-                               relief='flat', padx=8, pady=2, font=('Arial', 8, 'bold'))
+        tomorrow_btn = self._cyber_btn(quick_date_frame, "Tomorrow",
+                                       lambda: self.set_quick_date(1), self.colors['accent_magenta'],
+                                       padx=8, pady=2, font=self.fonts['bold8'])
         tomorrow_btn.pack(side=tk.LEFT, padx=2)
         
-        week_btn = tk.Button(quick_date_frame, text="Next Week",
-                           command=lambda: self.set_quick_date(7),
-                           bg=self.colors['accent_yellow'], fg=self.colors['bg_primary'],
-                           relief='flat', padx=8, pady=2, font=('Arial', 8, 'bold'))
+        week_btn = self._cyber_btn(quick_date_frame, "Next Week",
+                                   lambda: self.set_quick_date(7), self.colors['accent_yellow'],
+                                   padx=8, pady=2, font=self.fonts['bold8'])
         week_btn.pack(side=tk.LEFT, padx=2)
         
         # Time selection frame
@@ -287,75 +462,70 @@ class FuturisticTodo:
         time_label = ttk.Label(time_frame, text="⏰ Due Time:", 
                               background=self.colors['bg_primary'],
                               foreground=self.colors['accent_cyan'],
-                              font=('Arial', 10, 'bold'))
+                              font=self.fonts['bold10'])
         time_label.pack(side=tk.LEFT, padx=(0, 5))
         
-        # Time selection with current time as default
-        current_time = datetime.now()
-        
-        # Hour dropdown
-        self.hour_var = tk.StringVar(value=current_time.strftime("%H"))
-        hours = [f"{h:02d}" for h in range(24)]
-        hour_combo = ttk.Combobox(time_frame, textvariable=self.hour_var,
-                                values=hours, state="readonly", width=4)
-        hour_combo.pack(side=tk.LEFT, padx=(0, 2))
+        # Hour spinner, defaulting to the current time
+        self.hour_var = tk.StringVar(value=hour)
+        hour_spin = self._create_spinbox(time_frame, self.hour_var, 23)
+        hour_spin.pack(side=tk.LEFT, padx=(0, 2))
         
         time_sep1 = ttk.Label(time_frame, text=":", 
                              background=self.colors['bg_primary'],
                              foreground=self.colors['text_primary'],
-                             font=('Arial', 12, 'bold'))
+                             font=self.fonts['bold12'])
         time_sep1.pack(side=tk.LEFT)
         
-        # Minute dropdown
-        self.minute_var = tk.StringVar(value=current_time.strftime("%M"))
-        minutes = [f"{m:02d}" for m in range(0, 60, 15)]  # 15-minute intervals
-        minute_combo = ttk.Combobox(time_frame, textvariable=self.minute_var,
-                                  values=minutes, state="readonly", width=4)
-        minute_combo.pack(side=tk.LEFT, padx=(2, 5))
+        # Minute spinner
+        self.minute_var = tk.StringVar(value=minute)
+        minute_spin = self._create_spinbox(time_frame, self.minute_var, 59)
+        minute_spin.pack(side=tk.LEFT, padx=(2, 5))
         
         # Quick time buttons
         quick_time_frame = ttk.Frame(time_frame, style='Main.TFrame')
         quick_time_frame.pack(side=tk.LEFT, padx=(5, 0))
         
-        now_btn = tk.Button(quick_time_frame, text="Now",
-                          command=self.set_current_time,
-                          bg=self.colors['success'], fg=self.colors['bg_primary'],
-                          relief='flat', padx=8, pady=2, font=('Arial', 8, 'bold'))
+        now_btn = self._cyber_btn(quick_time_frame, "Now",
+                                  self.set_current_time, self.colors['success'],
+                                  padx=8, pady=2, font=self.fonts['bold8'])
         now_btn.pack(side=tk.LEFT, padx=2)
         
-        eod_btn = tk.Button(quick_time_frame, text="EOD",
-                          command=lambda: self.set_quick_time("17:00"),
-                          bg=self.colors['warning'], fg=self.colors['bg_primary'],
-                          relief='flat', padx=8, pady=2, font=('Arial', 8, 'bold'))
+        eod_btn = self._cyber_btn(quick_time_frame, "EOD",
+                                  lambda: self.set_quick_time("17:00"), self.colors['warning'],
+                                  padx=8, pady=2, font=self.fonts['bold8'])
         eod_btn.pack(side=tk.LEFT, padx=2)
         
-        # Initialize the date string
-        self.update_date_string()
+    def _create_date_picker(self, parent, variable):
+        """Create a YYYY-MM-DD date field, as a calendar drop-down when available"""
+        if DateEntry is not None:
+            return DateEntry(parent, textvariable=variable, 
+                           date_pattern='yyyy-mm-dd', width=12)
+        return ttk.Entry(parent, textvariable=variable, width=12)
+        
+    def _create_spinbox(self, parent, variable, to):
+        """Create a zero-padded numeric spinner for hours or minutes"""
+        return tk.Spinbox(parent, from_=0, to=to, width=3, wrap=True,
+                        textvariable=variable, format='%02.0f',
+                        bg=self.colors['bg_card'], fg=self.colors['text_primary'],
+                        buttonbackground=self.colors['bg_card'],
+                        insertbackground=self.colors['accent_cyan'],
+                        relief='flat', font=self.fonts['regular10'])
         
-    def update_date_string(self, event=None):
-        """Update the date string when dropdowns change"""
-        try:
-            year = self.year_var.get()
-            month = self.month_var.get()
-            day = self.day_var.get()
-            if year and month and day:
-                self.due_date_var.set(f"{year}-{month}-{day}")
-        except:
-            pass
-            
     def set_quick_date(self, days_offset):
         """Set date to today + offset days"""
         target_date = datetime.now() + timedelta(days=days_offset)
-        self.year_var.set(str(target_date.year))
-        self.month_var.set(target_date.strftime("%m"))
-        self.day_var.set(target_date.strftime("%d"))
-        self.update_date_string()
+        self.due_date_var.set(_date_parts(target_date)[0])
+        
+    def _now_parts(self):
+        """Current datetime plus its zero-padded date, hour and minute strings"""
+        now = datetime.now()
+        return (now,) + _date_parts(now)
         
     def set_current_time(self):
         """Set time to current time"""
-        current_time = datetime.now()
-        self.hour_var.set(current_time.strftime("%H"))
-        self.minute_var.set(current_time.strftime("%M"))
+        _, _, hour, minute = self._now_parts()
+        self.hour_var.set(hour)
+        self.minute_var.set(minute)
         
     def set_quick_time(self, time_str):
         """Set time to specified time (HH:MM format)"""
@@ -377,10 +547,9 @@ class FuturisticTodo:
                   ("completed", "COMPLETED"), ("high", "HIGH PRIORITY")]
         
         for filter_key, filter_text in filters:
-            btn = tk.Button(filter_buttons_frame, text=filter_text,
-                          command=lambda f=filter_key: self.set_filter(f),
-                          bg=self.colors['bg_card'], fg=self.colors['text_secondary'],
-                          relief='flat', padx=15, pady=8, font=('Arial', 9, 'bold'))
+            btn = self._cyber_btn(filter_buttons_frame, filter_text,
+                                  lambda f=filter_key: self.set_filter(f), self.colors['bg_card'],
+                                  fg=self.colors['text_secondary'], pady=8)
             btn.pack(side=tk.LEFT, padx=5)
             self.filter_buttons[filter_key] = btn
             
@@ -395,14 +564,16 @@ class FuturisticTodo:
         search_label = ttk.Label(search_frame, text="🔍", 
                                background=self.colors['bg_primary'],
                                foreground=self.colors['accent_cyan'],
-                               font=('Arial', 12))
+                               font=self.fonts['regular12'])
         search_label.pack(side=tk.LEFT, padx=(0, 5))
         
         self.search_var = tk.StringVar()
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var,
                                style='Cyber.TEntry', width=20)
         search_entry.pack(side=tk.LEFT)
-        search_entry.bind('<KeyRelease>', self.on_search)
+        
+        # Fires only when the text changes (typing, paste, cut), not on every key release
+        self.search_var.trace_add('write', self.on_search)
         
     def create_tasks_section(self, parent):
         """Create the tasks display area"""
@@ -411,59 +582,150 @@ class FuturisticTodo:
         
         # Create canvas for scrolling
         canvas = tk.Canvas(tasks_frame, bg=self.colors['bg_primary'], 
-                          highlightthickness=0, bd=0)
+                          highlightthickness=0, bd=0,
+                          yscrollincrement=self.ROW_HEIGHT)
         scrollbar = ttk.Scrollbar(tasks_frame, orient="vertical", command=canvas.yview)
-        self.scrollable_frame = ttk.Frame(canvas, style='Main.TFrame')
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Re-bind the row pool only when scrolling brings a different first row into view;
+        # yscrollcommand also fires for every item change inside the canvas
+        def _on_yscroll(first, last):
+            scrollbar.set(first, last)
+            if int(float(first) * len(self._filtered)) != self._first_visible:
+                self._refresh_visible()
+        canvas.configure(yscrollcommand=_on_yscroll)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Mouse wheel scrolling
+        # Mouse wheel scrolling, only over the canvas and its rows (see _create_row)
         def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            canvas.yview_scroll(-1 if event.delta > 0 else 1, "units")
+        canvas.bind_class('TaskList', "<MouseWheel>", _on_mousewheel)
+        canvas.bind_class('TaskList', "<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
+        canvas.bind_class('TaskList', "<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
+        canvas.bindtags(('TaskList',) + canvas.bindtags())
+        
+        self.tasks_canvas = canvas
+        
+        # Empty state lives on the canvas and is only shown/hidden
+        self._empty_item = canvas.create_text(
+            0, 80, text="🚀 No missions found\nCreate your first task to get started!",
+            fill=self.colors['text_secondary'], font=self.fonts['regular14'],
+            justify=tk.CENTER, state='hidden')
+        
+        canvas.bind("<Configure>", self._schedule_configure)
+        
+    def _schedule_configure(self, event):
+        """Coalesce a burst of resize events into a single relayout"""
+        if self._configure_job:
+            self.root.after_cancel(self._configure_job)
+        self._configure_job = self.root.after(120, lambda: self._on_canvas_configure(event))
+        
+    def _on_canvas_configure(self, event):
+        """Grow the row pool to cover the viewport and stretch rows to its width"""
+        self._configure_job = None
+        canvas = self.tasks_canvas
+        visible = math.ceil(event.height / self.ROW_HEIGHT) + 2
+        while len(self._row_pool) < visible:
+            self._row_pool.append(self._create_row())
+            
+        for row in self._row_pool:
+            canvas.itemconfigure(row.item, width=max(event.width - 10, 1))
+        canvas.coords(self._empty_item, event.width // 2, 80)
+        
+        self._refresh_visible()
+        
+    def _create_row(self):
+        """Create a reusable task row embedded in the tasks canvas"""
+        frame = tk.Frame(self.tasks_canvas, bg=self.colors['bg_card'], 
+                       relief='solid', bd=1)
+        row = TaskRow(frame, self.priority_colors, self.text_colors)
+        
+        # Fixed grid: indicator | content (stretches) | actions
+        frame.columnconfigure(1, weight=1)
+        frame.rowconfigure(0, weight=1)
         
-        self.tasks_container = self.scrollable_frame
+        # Priority color indicator
+        row.indicator = tk.Frame(frame, width=5, height=1)
+        row.indicator.grid(row=0, column=0, sticky='ns')
+        
+        # Main content
+        content_frame = tk.Frame(frame, bg=self.colors['bg_card'])
+        content_frame.grid(row=0, column=1, sticky='ew', padx=10, pady=10)
+        content_frame.columnconfigure(0, weight=1)
         
+        row.text_label = tk.Label(content_frame, textvariable=row.text_var, 
+                                bg=self.colors['bg_card'],
+                                font=self.fonts['bold12'], anchor='w')
+        row.text_label.grid(row=0, column=0, sticky='ew')
+        
+        meta_label = tk.Label(content_frame, textvariable=row.meta_var,
+                            bg=self.colors['bg_card'], fg=self.colors['text_secondary'],
+                            font=self.fonts['regular9'], anchor='w')
+        meta_label.grid(row=1, column=0, sticky='ew')
+        
+        # Action buttons dispatch through _row_action, which reads the row's task id at click time
+        actions_frame = tk.Frame(frame, bg=self.colors['bg_card'])
+        actions_frame.grid(row=0, column=2, padx=10)
+        
+        complete_btn = self._cyber_btn(actions_frame, "",
+                                       functools.partial(self._row_action, row, self.toggle_task),
+                                       self.colors['success'],
+                                       textvariable=row.complete_var, width=3, padx=8, pady=2, font=self.fonts['regular12'])
+        complete_btn.grid(row=0, column=0, pady=2)
+        
+        edit_btn = self._cyber_btn(actions_frame, "✏️",
+                                   functools.partial(self._row_action, row, self.edit_task),
+                                   self.colors['accent_cyan'], width=3, padx=8, pady=2, font=self.fonts['regular12'])
+        edit_btn.grid(row=1, column=0, pady=2)
+        
+        delete_btn = self._cyber_btn(actions_frame, "🗑️",
+                                     functools.partial(self._row_action, row, self.delete_task),
+                                     self.colors['error'],
+                                     fg=self.colors['text_primary'], width=3, padx=8, pady=2, font=self.fonts['regular12'])
+        delete_btn.grid(row=2, column=0, pady=2)
+        
+        # Rows cover the canvas, so they share its wheel bindings
+        widgets = [frame]
+        while widgets:
+            widget = widgets.pop()
+            widget.bindtags(('TaskList',) + widget.bindtags())
+            widgets.extend(widget.winfo_children())
+            
+        row.item = self.tasks_canvas.create_window(
+            5, 5, window=frame, anchor='nw',
+            height=self.ROW_HEIGHT - 10, state='hidden')
+        return row
+        
+    def _row_action(self, row, action):
+        """Run a row button's action on whichever task the row currently shows"""
+        if row.task_id is not None:
+            action(row.task_id)
+            
     def create_status_bar(self, parent):
         """Create status bar with action buttons"""
         status_frame = ttk.Frame(parent, style='Main.TFrame')
         status_frame.pack(fill=tk.X)
         
         # Theme toggle
-        theme_btn = tk.Button(status_frame, text="🌙 DARK MODE",
-                            command=self.toggle_theme,
-                            bg=self.colors['accent_magenta'], fg=self.colors['bg_primary'],
-                            relief='flat', padx=15, pady=5, font=('Arial', 9, 'bold'))
+        theme_btn = self._cyber_btn(status_frame, "🌙 DARK MODE",
+                                    self.toggle_theme, self.colors['accent_magenta'])
         theme_btn.pack(side=tk.LEFT)
         
         # Export button
-        export_btn = tk.Button(status_frame, text="📤 EXPORT",
-                             command=self.export_tasks,
-                             bg=self.colors['accent_yellow'], fg=self.colors['bg_primary'],
-                             relief='flat', padx=15, pady=5, font=('Arial', 9, 'bold'))
+        export_btn = self._cyber_btn(status_frame, "📤 EXPORT",
+                                     self.export_tasks, self.colors['accent_yellow'])
         export_btn.pack(side=tk.LEFT, padx=10)
         
         # Import button
-        import_btn = tk.Button(status_frame, text="📥 IMPORT",
-                             command=self.import_tasks,
-                             bg=self.colors['accent_cyan'], fg=self.colors['bg_primary'],
-                             relief='flat', padx=15, pady=5, font=('Arial', 9, 'bold'))
+        import_btn = self._cyber_btn(status_frame, "📥 IMPORT",
+                                     self.import_tasks, self.colors['accent_cyan'])
         import_btn.pack(side=tk.LEFT)
         
         # Clear all button
-        clear_btn = tk.Button(status_frame, text="🗑️ CLEAR ALL",
-                            command=self.clear_all_tasks,
-                            bg=self.colors['error'], fg=self.colors['text_primary'],
-                            relief='flat', padx=15, pady=5, font=('Arial', 9, 'bold'))
+        clear_btn = self._cyber_btn(status_frame, "🗑️ CLEAR ALL",
+                                    self.clear_all_tasks, self.colors['error'],
+                                    fg=self.colors['text_primary'])
         clear_btn.pack(side=tk.RIGHT)
         
         # Status label
@@ -471,7 +733,7 @@ class FuturisticTodo:
         status_label = ttk.Label(status_frame, textvariable=self.status_var,
                                background=self.colors['bg_primary'],
                                foreground=self.colors['text_secondary'],
-                               font=('Arial', 10))
+                               font=self.fonts['regular10'])
         status_label.pack(side=tk.RIGHT, padx=20)
         
     def add_task(self):
@@ -484,38 +746,36 @@ class FuturisticTodo:
         # Parse due date and time
         due_datetime = None
         try:
-            # Get date components
-            year = self.year_var.get()
-            month = self.month_var.get()
-            day = self.day_var.get()
+            # Get date and time components
+            date_str = self.due_date_var.get().strip()
             hour = self.hour_var.get()
             minute = self.minute_var.get()
             
-            if year and month and day:
+            if date_str:
                 # Create datetime object
-                due_datetime = datetime(
-                    int(year), int(month), int(day),
-                    int(hour) if hour else 23,
-                    int(minute) if minute else 59
+                due_datetime = datetime.strptime(date_str, "%Y-%m-%d").replace(
+                    hour=int(hour) if hour else 23,
+                    minute=int(minute) if minute else 59
                 )
                 due_datetime = due_datetime.isoformat()
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid date/time: {str(e)}")
             return
         
-        task = {
-            'id': str(uuid.uuid4()),
-            'text': task_text,
-            'completed': False,
-            'priority': self.priority_var.get().lower(),
-            'due_date': due_datetime,
-            'due_time': f"{self.hour_var.get()}:{self.minute_var.get()}" if self.hour_var.get() and self.minute_var.get() else None,
-            'created_at': datetime.now().isoformat(),
-            'notes': ''
-        }
+        task = Task(
+            id=self._new_id(),
+            text=task_text,
+            completed=False,
+            priority=self.priority_var.get().lower(),
+            due_date=due_datetime,
+            due_time=f"{self.hour_var.get()}:{self.minute_var.get()}" if self.hour_var.get() and self.minute_var.get() else None,
+            created_at=datetime.now().isoformat(),
+            notes=''
+        )
         
         self.tasks.insert(0, task)
-        self.save_tasks()
+        self._index_task(task)
+        self.save_tasks(task)
         self.render_tasks()
         self.update_stats()
         
@@ -528,45 +788,57 @@ class FuturisticTodo:
         
     def reset_datetime_to_current(self):
         """Reset date and time to current values"""
-        current = datetime.now()
-        self.year_var.set(str(current.year))
-        self.month_var.set(current.strftime("%m"))
-        self.day_var.set(current.strftime("%d"))
-        self.hour_var.set(current.strftime("%H"))
-        self.minute_var.set(current.strftime("%M"))
-        self.update_date_string()
+        _, today, hour, minute = self._now_parts()
+        self.due_date_var.set(today)
+        self.hour_var.set(hour)
+        self.minute_var.set(minute)
         
     def toggle_task(self, task_id):
         """Toggle task completion status"""
-        for task in self.tasks:
-            if task['id'] == task_id:
-                task['completed'] = not task['completed']
-                task['completed_at'] = datetime.now().isoformat() if task['completed'] else None
-                break
+        task = self._by_id.get(task_id)
+        if not task:
+            return
+            
+        task.completed = not task.completed
+        task.completed_at = datetime.now().isoformat() if task.completed else None
+        
+        if task.completed:
+            self._pending_ids.discard(task_id)
+            self._completed_ids.add(task_id)
+        else:
+            self._completed_ids.discard(task_id)
+            self._pending_ids.add(task_id)
                 
-        self.save_tasks()
-        self.render_tasks()
+        self.save_tasks(task)
+        
+        # Completion doesn't affect sort order or search, so unless the filter is by
+        # completion state the list stays the same and only the task's own row changes
+        if self.current_filter in ('pending', 'completed'):
+            self.render_tasks()
+        else:
+            self._refresh_task_row(task)
         self.update_stats()
         
-        status = "Mission completed! 🎉" if task['completed'] else "Mission reopened! 🔄"
+        status = "Mission completed! 🎉" if task.completed else "Mission reopened! 🔄"
         self.show_status(status, success=True)
         
     def delete_task(self, task_id):
         """Delete a task"""
+        task = self._by_id.get(task_id)
+        if task is None:
+            return
+            
         if messagebox.askyesno("Confirm", "Delete this mission?"):
-            self.tasks = [t for t in self.tasks if t['id'] != task_id]
-            self.save_tasks()
+            self.tasks.remove(task)
+            self._unindex_task(task_id)
+            self._append_wal({'op': 'delete', 'id': task_id})
             self.render_tasks()
             self.update_stats()
             self.show_status("Mission deleted! 🗑️")
             
-    def edit_task(self, task_id):
-        """Edit a task with enhanced date/time dialog"""
-        task = next((t for t in self.tasks if t['id'] == task_id), None)
-        if not task:
-            return
-            
-        # Create edit dialog
+    def _build_edit_dialog(self):
+        """Create the edit dialog once; edit_task re-fills and shows it"""
+        self._edit_task_id = None
         edit_window = tk.Toplevel(self.root)
         edit_window.title("🛠️ Edit Mission")
         edit_window.geometry("500x450")
@@ -575,7 +847,9 @@ class FuturisticTodo:
         
         # Center the dialog
         edit_window.transient(self.root)
-        edit_window.grab_set()
+        edit_window.protocol("WM_DELETE_WINDOW", self._close_edit)
+        edit_window.withdraw()
+        self._edit_win = edit_window
         
         # Main frame with scrollbar
         main_frame = tk.Frame(edit_window, bg=self.colors['bg_card'])
@@ -583,20 +857,20 @@ class FuturisticTodo:
         
         # Task text
         tk.Label(main_frame, text="Mission:", bg=self.colors['bg_card'], 
-                fg=self.colors['text_primary'], font=('Arial', 10, 'bold')).pack(anchor='w', pady=(0,5))
+                fg=self.colors['text_primary'], font=self.fonts['bold10']).pack(anchor='w', pady=(0,5))
         
-        text_var = tk.StringVar(value=task['text'])
-        text_entry = tk.Entry(main_frame, textvariable=text_var, width=60,
+        self._edit_text_var = tk.StringVar()
+        text_entry = tk.Entry(main_frame, textvariable=self._edit_text_var, width=60,
                             bg=self.colors['bg_primary'], fg=self.colors['text_primary'],
-                            insertbackground=self.colors['accent_cyan'], font=('Arial', 11))
+                            insertbackground=self.colors['accent_cyan'], font=self.fonts['regular11'])
         text_entry.pack(fill=tk.X, pady=(0,15))
         
         # Priority
         tk.Label(main_frame, text="Priority:", bg=self.colors['bg_card'], 
-                fg=self.colors['text_primary'], font=('Arial', 10, 'bold')).pack(anchor='w', pady=(0,5))
+                fg=self.colors['text_primary'], font=self.fonts['bold10']).pack(anchor='w', pady=(0,5))
         
-        priority_var = tk.StringVar(value=task['priority'].capitalize())
-        priority_combo = ttk.Combobox(main_frame, textvariable=priority_var,
+        self._edit_priority_var = tk.StringVar()
+        priority_combo = ttk.Combobox(main_frame, textvariable=self._edit_priority_var,
                                     values=["Low", "Medium", "High", "Critical"],
                                     state="readonly", width=15)
         priority_combo.pack(anchor='w', pady=(0,15))
@@ -606,284 +880,280 @@ class FuturisticTodo:
         datetime_frame.pack(fill=tk.X, pady=(0,15))
         
         tk.Label(datetime_frame, text="Due Date & Time:", bg=self.colors['bg_card'], 
-                fg=self.colors['text_primary'], font=('Arial', 10, 'bold')).pack(anchor='w', pady=(0,5))
-        
-        # Parse existing due date/time
-        current_datetime = datetime.now()
-        if task.get('due_date'):
-            try:
-                current_datetime = datetime.fromisoformat(task['due_date'])
-            except:
-                pass
+                fg=self.colors['text_primary'], font=self.fonts['bold10']).pack(anchor='w', pady=(0,5))
         
         # Date selection
         date_frame = tk.Frame(datetime_frame, bg=self.colors['bg_card'])
         date_frame.pack(anchor='w', pady=(0,5))
         
         tk.Label(date_frame, text="📅 Date:", bg=self.colors['bg_card'], 
-                fg=self.colors['accent_cyan'], font=('Arial', 9, 'bold')).pack(side=tk.LEFT, padx=(0,5))
-        
-        edit_year_var = tk.StringVar(value=str(current_datetime.year))
-        year_combo = ttk.Combobox(date_frame, textvariable=edit_year_var,
-                                values=[str(y) for y in range(current_datetime.year, current_datetime.year + 5)],
-                                state="readonly", width=6)
-        year_combo.pack(side=tk.LEFT, padx=2)
-        
-        edit_month_var = tk.StringVar(value=current_datetime.strftime("%m"))
-        month_combo = ttk.Combobox(date_frame, textvariable=edit_month_var,
-                                 values=[f"{m:02d}" for m in range(1, 13)],
-                                 state="readonly", width=4)
-        month_combo.pack(side=tk.LEFT, padx=2)
-        
-        edit_day_var = tk.StringVar(value=current_datetime.strftime("%d"))
-        day_combo = ttk.Combobox(date_frame, textvariable=edit_day_var,
-                               values=[f"{d:02d}" for d in range(1, 32)],
-                               state="readonly", width=4)
-        day_combo.pack(side=tk.LEFT, padx=2)
+                fg=self.colors['accent_cyan'], font=self.fonts['bold9']).pack(side=tk.LEFT, padx=(0,5))
+        
+        edit_date_var = self._edit_date_var = tk.StringVar()
+        date_picker = self._create_date_picker(date_frame, edit_date_var)
+        date_picker.pack(side=tk.LEFT, padx=2)
         
         # Time selection
         time_frame = tk.Frame(datetime_frame, bg=self.colors['bg_card'])
         time_frame.pack(anchor='w', pady=(0,10))
         
         tk.Label(time_frame, text="⏰ Time:", bg=self.colors['bg_card'], 
-                fg=self.colors['accent_cyan'], font=('Arial', 9, 'bold')).pack(side=tk.LEFT, padx=(0,5))
+                fg=self.colors['accent_cyan'], font=self.fonts['bold9']).pack(side=tk.LEFT, padx=(0,5))
         
-        edit_hour_var = tk.StringVar(value=current_datetime.strftime("%H"))
-        hour_combo = ttk.Combobox(time_frame, textvariable=edit_hour_var,
-                                values=[f"{h:02d}" for h in range(24)],
-                                state="readonly", width=4)
-        hour_combo.pack(side=tk.LEFT, padx=2)
+        edit_hour_var = self._edit_hour_var = tk.StringVar()
+        hour_spin = self._create_spinbox(time_frame, edit_hour_var, 23)
+        hour_spin.pack(side=tk.LEFT, padx=2)
         
         tk.Label(time_frame, text=":", bg=self.colors['bg_card'], 
-                fg=self.colors['text_primary'], font=('Arial', 12, 'bold')).pack(side=tk.LEFT)
+                fg=self.colors['text_primary'], font=self.fonts['bold12']).pack(side=tk.LEFT)
         
-        edit_minute_var = tk.StringVar(value=current_datetime.strftime("%M"))
-        minute_combo = ttk.Combobox(time_frame, textvariable=edit_minute_var,
-                                  values=[f"{m:02d}" for m in range(0, 60, 15)],
-                                  state="readonly", width=4)
-        minute_combo.pack(side=tk.LEFT, padx=(2,10))
+        edit_minute_var = self._edit_minute_var = tk.StringVar()
+        minute_spin = self._create_spinbox(time_frame, edit_minute_var, 59)
+        minute_spin.pack(side=tk.LEFT, padx=(2,10))
         
         # Quick datetime buttons
         quick_btn_frame = tk.Frame(time_frame, bg=self.colors['bg_card'])
         quick_btn_frame.pack(side=tk.LEFT, padx=(10,0))
         
         def set_edit_now():
-            now = datetime.now()
-            edit_year_var.set(str(now.year))
-            edit_month_var.set(now.strftime("%m"))
-            edit_day_var.set(now.strftime("%d"))
-            edit_hour_var.set(now.strftime("%H"))
-            edit_minute_var.set(now.strftime("%M"))
-        
-        now_btn = tk.Button(quick_btn_frame, text="Now",
-                          command=set_edit_now,
-                          bg=self.colors['success'], fg=self.colors['bg_primary'],
-                          relief='flat', padx=6, pady=2, font=('Arial', 8, 'bold'))
+            _, today, hour, minute = self._now_parts()
+            edit_date_var.set(today)
+            edit_hour_var.set(hour)
+            edit_minute_var.set(minute)
+        
+        now_btn = self._cyber_btn(quick_btn_frame, "Now",
+                                  set_edit_now, self.colors['success'],
+                                  padx=6, pady=2, font=self.fonts['bold8'])
         now_btn.pack(side=tk.LEFT, padx=1)
         
         def set_edit_tomorrow():
             tomorrow = datetime.now() + timedelta(days=1)
-            edit_year_var.set(str(tomorrow.year))
-            edit_month_var.set(tomorrow.strftime("%m"))
-            edit_day_var.set(tomorrow.strftime("%d"))
-        
-        tomorrow_btn = tk.Button(quick_btn_frame, text="Tomorrow",
-                               command=set_edit_tomorrow,
-                               bg=self.colors['accent_magenta'], fg=self.colors['bg_primary'],
-                               relief='flat', padx=6, pady=2, font=('Arial', 8, 'bold'))
+            edit_date_var.set(_date_parts(tomorrow)[0])
+        
+        tomorrow_btn = self._cyber_btn(quick_btn_frame, "Tomorrow",
+                                       set_edit_tomorrow, self.colors['accent_magenta'],
+                                       padx=6, pady=2, font=self.fonts['bold8'])
         tomorrow_btn.pack(side=tk.LEFT, padx=1)
         
         # Notes
         tk.Label(main_frame, text="Notes:", bg=self.colors['bg_card'], 
-                fg=self.colors['text_primary'], font=('Arial', 10, 'bold')).pack(anchor='w', pady=(0,5))
+                fg=self.colors['text_primary'], font=self.fonts['bold10']).pack(anchor='w', pady=(0,5))
         
-        notes_text = tk.Text(main_frame, height=4, width=60,
+        self._edit_notes = tk.Text(main_frame, height=4, width=60,
                            bg=self.colors['bg_primary'], fg=self.colors['text_primary'],
-                           insertbackground=self.colors['accent_cyan'], font=('Arial', 10))
-        notes_text.pack(fill=tk.X, pady=(0,20))
-        notes_text.insert('1.0', task.get('notes', ''))
+                           insertbackground=self.colors['accent_cyan'], font=self.fonts['regular10'])
+        self._edit_notes.pack(fill=tk.X, pady=(0,20))
         
         # Buttons
         btn_frame = tk.Frame(main_frame, bg=self.colors['bg_card'])
         btn_frame.pack(fill=tk.X)
         
-        def save_changes():
-            try:
-                # Create new datetime
-                new_datetime = datetime(
-                    int(edit_year_var.get()),
-                    int(edit_month_var.get()),
-                    int(edit_day_var.get()),
-                    int(edit_hour_var.get()),
-                    int(edit_minute_var.get())
-                )
-                
-                task['text'] = text_var.get().strip()
-                task['priority'] = priority_var.get().lower()
-                task['due_date'] = new_datetime.isoformat()
-                task['due_time'] = f"{edit_hour_var.get()}:{edit_minute_var.get()}"
-                task['notes'] = notes_text.get('1.0', tk.END).strip()
-                task['updated_at'] = datetime.now().isoformat()
-                
-                self.save_tasks()
-                self.render_tasks()
-                self.update_stats()
-                edit_window.destroy()
-                self.show_status("Mission updated successfully! ✨", success=True)
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save changes: {str(e)}")
-        
-        save_btn = tk.Button(btn_frame, text="💾 SAVE CHANGES", command=save_changes,
-                           bg=self.colors['success'], fg=self.colors['bg_primary'],
-                           relief='flat', padx=20, pady=8, font=('Arial', 10, 'bold'))
+        save_btn = self._cyber_btn(btn_frame, "💾 SAVE CHANGES",
+                                   self._commit_edit, self.colors['success'],
+                                   padx=20, pady=8, font=self.fonts['bold10'])
         save_btn.pack(side=tk.LEFT, padx=(0,10))
         
-        cancel_btn = tk.Button(btn_frame, text="❌ CANCEL", command=edit_window.destroy,
-                             bg=self.colors['error'], fg=self.colors['text_primary'],
-                             relief='flat', padx=20, pady=8, font=('Arial', 10, 'bold'))
+        cancel_btn = self._cyber_btn(btn_frame, "❌ CANCEL",
+                                     self._close_edit, self.colors['error'],
+                                     fg=self.colors['text_primary'], padx=20, pady=8, font=self.fonts['bold10'])
         cancel_btn.pack(side=tk.LEFT)
         
-    def render_tasks(self):
-        """Render all tasks in the display area"""
-        # Clear existing tasks
-        for widget in self.tasks_container.winfo_children():
-            widget.destroy()
+    def edit_task(self, task_id):
+        """Edit a task with enhanced date/time dialog"""
+        task = self._by_id.get(task_id)
+        if not task:
+            return
             
-        filtered_tasks = self.get_filtered_tasks()
-        
-        if not filtered_tasks:
-            # Show empty state
-            empty_frame = tk.Frame(self.tasks_container, bg=self.colors['bg_primary'])
-            empty_frame.pack(fill=tk.X, pady=50)
+        # Existing due date/time was parsed when the task was indexed
+        current_datetime = task._due_dt or datetime.now()
+                
+        self._edit_task_id = task_id
+        self._edit_text_var.set(task.text)
+        self._edit_priority_var.set(task.priority.capitalize())
+        date_str, hour, minute = _date_parts(current_datetime)
+        self._edit_date_var.set(date_str)
+        self._edit_hour_var.set(hour)
+        self._edit_minute_var.set(minute)
+        self._edit_notes.delete('1.0', tk.END)
+        self._edit_notes.insert('1.0', task.notes)
+        
+        self._edit_win.deiconify()
+        self._edit_win.grab_set()
+        
+    def _commit_edit(self):
+        """Write the edit dialog's values back into the task being edited"""
+        task = self._by_id.get(self._edit_task_id)
+        if not task:
+            self._close_edit()
+            return
             
-            empty_label = tk.Label(empty_frame, text="🚀 No missions found\nCreate your first task to get started!",
-                                 bg=self.colors['bg_primary'], fg=self.colors['text_secondary'],
-                                 font=('Arial', 14), justify=tk.CENTER)
-            empty_label.pack()
+        # Validate the spinbox values up front instead of relying on int() raising
+        hour = self._edit_hour_var.get().strip()
+        minute = self._edit_minute_var.get().strip()
+        if not (hour.isdecimal() and minute.isdecimal() and int(hour) < 24 and int(minute) < 60):
+            messagebox.showerror("Error", "Invalid time: hour must be 0-23 and minute 0-59")
             return
             
-        # Render tasks
-        for i, task in enumerate(filtered_tasks):
-            self.create_task_widget(task, i)
+        try:
+            new_datetime = datetime.strptime(self._edit_date_var.get().strip(), "%Y-%m-%d").replace(
+                hour=int(hour), minute=int(minute))
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid date: {str(e)}")
+            return
             
-    def create_task_widget(self, task, index):
-        """Create a widget for a single task"""
-        # Task container
-        task_frame = tk.Frame(self.tasks_container, bg=self.colors['bg_card'], 
-                            relief='solid', bd=1)
-        task_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        # Priority color indicator
-        priority_colors = {
-            'low': self.colors['success'],
-            'medium': self.colors['warning'],
-            'high': self.colors['error'],
-            'critical': self.colors['error']
-        }
-        
-        priority_indicator = tk.Frame(task_frame, bg=priority_colors.get(task['priority'], self.colors['success']),
-                                    width=5, height=1)
-        priority_indicator.pack(side=tk.LEFT, fill=tk.Y)
-        
-        # Main content
-        content_frame = tk.Frame(task_frame, bg=self.colors['bg_card'])
-        content_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=10, pady=10)
-        
-        # Task text
-        text_color = self.colors['text_secondary'] if task['completed'] else self.colors['text_primary']
-        task_text = task['text']
-        if task['completed']:
-            task_text = f"✅ {task_text}"
-        
-        text_label = tk.Label(content_frame, text=task_text, bg=self.colors['bg_card'],
-                            fg=text_color, font=('Arial', 12, 'bold'), anchor='w')
-        text_label.pack(fill=tk.X)
+        task.text = self._edit_text_var.get().strip()
+        task.priority = self._edit_priority_var.get().lower()
+        task.due_date = new_datetime.isoformat()
+        task.due_time = f"{hour}:{minute}"
+        task.notes = self._edit_notes.get('1.0', tk.END).strip()
+        task.updated_at = datetime.now().isoformat()
+        
+        self._index_task(task)
+        self.save_tasks(task)
+        self.render_tasks()
+        self.update_stats()
+        self._close_edit()
+        self.show_status("Mission updated successfully! ✨", success=True)
         
-        # Meta info
-        meta_info = []
-        meta_info.append(f"Priority: {task['priority'].upper()}")
+    def _close_edit(self):
+        """Hide the edit dialog for reuse instead of destroying it"""
+        self._edit_task_id = None
+        self._edit_win.grab_release()
+        self._edit_win.withdraw()
         
-        if task['due_date']:
-            try:
-                due_datetime = datetime.fromisoformat(task['due_date'])
-                due_date_str = due_datetime.strftime("%Y-%m-%d")
-                due_time_str = due_datetime.strftime("%H:%M")
-                is_overdue = due_datetime < datetime.now() and not task['completed']
-                due_color = self.colors['error'] if is_overdue else self.colors['text_secondary']
+    def render_tasks(self):
+        """Render the filtered tasks through the recycled row pool"""
+        self._filtered = self.get_filtered_tasks()
+        self.tasks_canvas.configure(
+            scrollregion=(0, 0, 0, len(self._filtered) * self.ROW_HEIGHT))
+        self._refresh_visible()
+        
+    def _refresh_visible(self):
+        """Bind the pooled rows to the tasks currently in the viewport"""
+        canvas = self.tasks_canvas
+        filtered = self._filtered
+        first = self._first_visible = int(canvas.yview()[0] * len(filtered))
+        now = time.time()
+        
+        for i, row in enumerate(self._row_pool):
+            index = first + i
+            if index < len(filtered):
+                row.update(filtered[index], now)
                 
-                # Show both date and time
-                meta_info.append(f"Due: {due_date_str} at {due_time_str}")
+                # Only touch the canvas item when the slot actually moves or reappears
+                y = index * self.ROW_HEIGHT + 5
+                if row.y != y:
+                    canvas.coords(row.item, 5, y)
+                    row.y = y
+                if not row.shown:
+                    canvas.itemconfigure(row.item, state='normal')
+                    row.shown = True
+            else:
+                row.task_id = None
+                if row.shown:
+                    canvas.itemconfigure(row.item, state='hidden')
+                    row.shown = False
                 
-                # Add overdue indicator if applicable
-                if is_overdue:
-                    meta_info.append("⚠️ OVERDUE")
-            except:
-                # Fallback for old format
-                due_date = datetime.fromisoformat(task['due_date']).strftime("%Y-%m-%d")
-                meta_info.append(f"Due: {due_date}")
-        
-        created_date = datetime.fromisoformat(task['created_at']).strftime("%m/%d %H:%M")
-        meta_info.append(f"Created: {created_date}")
-        
-        meta_label = tk.Label(content_frame, text=" | ".join(meta_info),
-                            bg=self.colors['bg_card'], fg=self.colors['text_secondary'],
-                            font=('Arial', 9), anchor='w')
-        meta_label.pack(fill=tk.X)
-        
-        # Action buttons
-        actions_frame = tk.Frame(task_frame, bg=self.colors['bg_card'])
-        actions_frame.pack(side=tk.RIGHT, padx=10)
-        
-        # Complete button
-        complete_text = "✅" if not task['completed'] else "🔄"
-        complete_btn = tk.Button(actions_frame, text=complete_text,
-                               command=lambda: self.toggle_task(task['id']),
-                               bg=self.colors['success'], fg=self.colors['bg_primary'],
-                               relief='flat', width=3, font=('Arial', 12))
-        complete_btn.pack(side=tk.TOP, pady=2)
-        
-        # Edit button
-        edit_btn = tk.Button(actions_frame, text="✏️",
-                           command=lambda: self.edit_task(task['id']),
-                           bg=self.colors['accent_cyan'], fg=self.colors['bg_primary'],
-                           relief='flat', width=3, font=('Arial', 12))
-        edit_btn.pack(side=tk.TOP, pady=2)
-        
-        # Delete button
-        delete_btn = tk.Button(actions_frame, text="🗑️",
-                             command=lambda: self.delete_task(task['id']),
-                             bg=self.colors['error'], fg=self.colors['text_primary'],
-                             relief='flat', width=3, font=('Arial', 12))
-        delete_btn.pack(side=tk.TOP, pady=2)
+        canvas.itemconfigure(self._empty_item, state='hidden' if filtered else 'normal')
         
+    def _refresh_task_row(self, task):
+        """Update the pooled row showing a task in place, if it is on screen"""
+        for row in self._row_pool:
+            if row.task_id == task.id:
+                row.update(task, time.time())
+                break
+                
     def get_filtered_tasks(self):
         """Get tasks based on current filter and search"""
-        filtered = self.tasks.copy()
-        
-        # Apply search filter
-        if self.search_query:
-            filtered = [t for t in filtered if 
-                       self.search_query in t['text'].lower() or 
-                       self.search_query in t.get('notes', '').lower()]
-        
-        # Apply category filter
-        if self.current_filter == 'pending':
-            filtered = [t for t in filtered if not t['completed']]
-        elif self.current_filter == 'completed':
-            filtered = [t for t in filtered if t['completed']]
-        elif self.current_filter == 'high':
-            filtered = [t for t in filtered if t['priority'] in ['high', 'critical']]
-        
-        # Sort by priority and creation date
-        priority_order = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
-        
-        def sort_key(task):
-            priority_val = priority_order.get(task['priority'], 1)
-            created_date = datetime.fromisoformat(task['created_at'])
-            return (-priority_val, -created_date.timestamp())
-        
-        return sorted(filtered, key=sort_key)
+        base = {'pending': self._pending_ids,
+                'completed': self._completed_ids,
+                'high': self._high_ids}.get(self.current_filter)
+        query = self.search_query
+        lc_text = self._lc_text
+        sort_key = self._sort_keys.__getitem__
+        
+        # Sort by priority and creation date, newest first, using the precomputed key column;
+        # ISO-8601 strings order chronologically as plain text, so no datetime is needed
+        if not query:
+            # No search: sorted() builds the only list needed straight from the index
+            selected = sorted(lc_text if base is None else base, key=sort_key, reverse=True)
+        else:
+            # Filter through the precomputed index instead of re-lowering text
+            if base is None:
+                selected = [task_id for task_id, text in lc_text.items() if query in text]
+            else:
+                selected = [task_id for task_id in base if query in lc_text[task_id]]
+            selected.sort(key=sort_key, reverse=True)
+        return list(map(self._by_id.__getitem__, selected))
     
+    def _precompute_fields(self, task):
+        """Store the priority rank, timestamps and display strings used when rendering"""
+        task.priority_rank = PRIORITY_RANK.get(task.priority, 0)
+        
+        task.due_ts = None
+        task._due_dt = None
+        task._due_display = ''
+        if task.due_date:
+            try:
+                due_datetime = task._due_dt = _parse_iso(task.due_date)
+                task.due_ts = due_datetime.timestamp()
+                date_str, hour, minute = _date_parts(due_datetime)
+                task._due_display = f"Due: {date_str} at {hour}:{minute}"
+            except ValueError:
+                # Fallback for unparseable dates
+                task._due_display = f"Due: {task.due_date}"
+                
+        created_at = task.created_at
+        if len(created_at) >= 16 and created_at[10] == 'T':
+            # Our own isoformat() output: slice MM/DD HH:MM out without parsing
+            task._created_display = f"{created_at[5:7]}/{created_at[8:10]} {created_at[11:16]}"
+        else:
+            created = _parse_iso(created_at)
+            task._created_display = f"{created.month:02d}/{created.day:02d} {created.hour:02d}:{created.minute:02d}"
+                
+    def _index_task(self, task, precomputed=False):
+        """Add or refresh a task in the search/filter index; pass precomputed=True when
+        _precompute_fields has already run on it"""
+        if not precomputed:
+            self._precompute_fields(task)
+        task_id = task.id
+        self._by_id[task_id] = task
+        # Lowered once per add/edit/load; quick-added tasks usually have no notes to join
+        self._lc_text[task_id] = (f"{task.text}\n{task.notes}" if task.notes else task.text).lower()
+        self._sort_keys[task_id] = (task.priority_rank, task.created_at)
+        
+        if task.completed:
+            self._pending_ids.discard(task_id)
+            self._completed_ids.add(task_id)
+        else:
+            self._completed_ids.discard(task_id)
+            self._pending_ids.add(task_id)
+            
+        if task.priority in ('high', 'critical'):
+            self._high_ids.add(task_id)
+        else:
+            self._high_ids.discard(task_id)
+            
+    def _unindex_task(self, task_id):
+        """Remove a task from the search/filter index"""
+        self._by_id.pop(task_id, None)
+        self._sort_keys.pop(task_id, None)
+        self._lc_text.pop(task_id, None)
+        self._pending_ids.discard(task_id)
+        self._completed_ids.discard(task_id)
+        self._high_ids.discard(task_id)
+        
+    def _rebuild_index(self):
+        """Rebuild the search/filter index after a bulk change"""
+        self._by_id.clear()
+        self._sort_keys.clear()
+        self._lc_text.clear()
+        self._pending_ids.clear()
+        self._completed_ids.clear()
+        self._high_ids.clear()
+        for task in self.tasks:
+            self._index_task(task)
+            
     def set_filter(self, filter_key):
         """Set the current filter"""
         # Reset all button colors
@@ -897,9 +1167,21 @@ class FuturisticTodo:
         self.current_filter = filter_key
         self.render_tasks()
         
-    def on_search(self, event=None):
-        """Handle search input"""
-        self.search_query = self.search_var.get().lower()
+    def on_search(self, *args):
+        """Handle search input, rendering only once typing pauses"""
+        if self._search_job:
+            self.root.after_cancel(self._search_job)
+        self._search_job = self.root.after(150, self._do_search)
+        
+    def _do_search(self):
+        """Apply the current search text"""
+        self._search_job = None
+        query = self.search_var.get().lower()
+        
+        # Edits that cancel out within the debounce window leave nothing to re-render
+        if query == self.search_query:
+            return
+        self.search_query = query
         self.render_tasks()
         
     def clear_placeholder(self, event):
@@ -909,13 +1191,33 @@ class FuturisticTodo:
             
     def update_stats(self):
         """Update statistics display"""
-        total = len(self.tasks)
-        completed = sum(1 for t in self.tasks if t['completed'])
-        pending = total - completed
+        # Counts come straight from the filter index, which is kept up to date
+        counts = {
+            'total': len(self._by_id),
+            'completed': len(self._completed_ids),
+            'pending': len(self._pending_ids)
+        }
         
-        self.stats_vars['total'].set(str(total))
-        self.stats_vars['completed'].set(str(completed))
-        self.stats_vars['pending'].set(str(pending))
+        # Only touch variables whose value changed, to skip label redraws
+        for key, count in counts.items():
+            value = str(count)
+            if self.stats_vars[key].get() != value:
+                self.stats_vars[key].set(value)
+        
+    def _check_due(self):
+        """Refresh overdue markers and announce tasks that just became overdue"""
+        # Only due times that passed since the last check are news; tasks loaded, imported
+        # or reopened while already overdue stay quiet without any extra bookkeeping
+        now = time.time()
+        last_check, self._last_due_check = self._last_due_check, now
+        newly_overdue = [t for t in self.tasks
+                         if t.due_ts is not None and not t.completed and last_check < t.due_ts <= now]
+        
+        if newly_overdue:
+            self._refresh_visible()
+            self.show_status(f"⚠️ {len(newly_overdue)} mission(s) now overdue!")
+            
+        self.root.after(60_000, self._check_due)
         
     def show_status(self, message, success=False):
         """Show status message"""
@@ -923,75 +1225,164 @@ class FuturisticTodo:
         # Reset status after 3 seconds
         self.root.after(3000, lambda: self.status_var.set("Ready for missions! 🚀"))
         
-    def save_tasks(self):
-        """Save tasks to JSON file"""
+    def save_tasks(self, task=None):
+        """Journal a single changed task, or snapshot all tasks right away"""
+        if task is None:
+            self._dirty = True
+            self._flush_snapshot()
+        else:
+            self._append_wal({'op': 'put', 'task': task.to_dict()})
+            
+    def _append_wal(self, record):
+        """Append one change to the journal and debounce the full snapshot"""
+        try:
+            with open(self.wal_file, 'ab') as f:
+                f.write(_dumps(record, indent=False) + b"\n")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save tasks: {str(e)}")
+            return
+            
+        self._dirty = True
+        if self._save_job:
+            self.root.after_cancel(self._save_job)
+        self._save_job = self.root.after(2000, self._flush_snapshot)
+        
+    def _flush_snapshot(self):
+        """Write all tasks to the data file and truncate the journal"""
+        if self._save_job:
+            self.root.after_cancel(self._save_job)
+            self._save_job = None
+        if not self._dirty:
+            return
+            
         try:
-            with open(self.data_file, 'w') as f:
-                json.dump(self.tasks, f, indent=2)
+            # Compact JSON to a temp file, then swap it in so a crash never leaves a torn file
+            tmp_file = self.data_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps([t.to_dict() for t in self.tasks], indent=False))
+            os.replace(tmp_file, self.data_file)
+            if os.path.exists(self.wal_file):
+                os.remove(self.wal_file)
+            self._dirty = False
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save tasks: {str(e)}")
             
     def load_tasks(self):
-        """Load tasks from JSON file"""
+        """Load tasks from JSON file and replay any journaled changes"""
         try:
             if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    self.tasks = json.load(f)
-                self.render_tasks()
+                with open(self.data_file, 'rb') as f:
+                    self.tasks = [Task.from_dict(data) for data in _loads(f.read())]
+            if self._replay_wal():
+                # Fold the replayed journal into a snapshot right away so it never
+                # outlives this session (ids it deleted may be handed out again)
+                self._dirty = True
+                self._flush_snapshot()
+            self._reset_next_id()
+            self._rebuild_index()
+            self.render_tasks()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load tasks: {str(e)}")
             
+    def _new_id(self):
+        """Return a fresh sequential task id"""
+        task_id = str(self._next_id)
+        self._next_id += 1
+        return task_id
+        
+    def _reset_next_id(self):
+        """Continue numbering after the highest numeric id in the task list"""
+        self._next_id = 1 + max((int(t.id) for t in self.tasks if str(t.id).isdecimal()),
+                                default=-1)
+        
+    def _replay_wal(self):
+        """Apply journal records on top of the loaded tasks"""
+        if not os.path.exists(self.wal_file):
+            return False
+            
+        # Records are applied in journal order, so an id deleted and later reused comes back
+        by_id = {t.id: t for t in self.tasks}
+        snapshot_ids = set(by_id)
+        new_ids = []
+        with open(self.wal_file, 'rb') as f:
+            for line in f:
+                try:
+                    record = _loads(line)
+                except ValueError:
+                    # Partially written last line
+                    continue
+                    
+                if record['op'] == 'delete':
+                    by_id.pop(record['id'], None)
+                    snapshot_ids.discard(record['id'])
+                else:
+                    task = Task.from_dict(record['task'])
+                    if task.id not in by_id and task.id not in snapshot_ids:
+                        new_ids.append(task.id)
+                    by_id[task.id] = task
+                    
+        # New tasks are always added at the top, latest first
+        order = new_ids[::-1] + [t.id for t in self.tasks if t.id in snapshot_ids]
+        self.tasks = []
+        for task_id in order:
+            task = by_id.pop(task_id, None)
+            if task is not None:
+                self.tasks.append(task)
+        return True
+            
     def add_welcome_tasks_if_empty(self):
         """Add welcome tasks if no tasks exist"""
         if not self.tasks:
             # Create welcome tasks with specific times to showcase the feature
-            tomorrow_9am = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=1)
-            next_week_5pm = datetime.now().replace(hour=17, minute=0, second=0, microsecond=0) + timedelta(days=7)
-            today_eod = datetime.now().replace(hour=17, minute=30, second=0, microsecond=0)
+            now = datetime.now()
+            tomorrow_9am = now.replace(hour=9, minute=0, second=0, microsecond=0) + timedelta(days=1)
+            next_week_5pm = now.replace(hour=17, minute=0, second=0, microsecond=0) + timedelta(days=7)
+            today_eod = now.replace(hour=17, minute=30, second=0, microsecond=0)
             
             welcome_tasks = [
-                {
-                    'id': str(uuid.uuid4()),
-                    'text': 'Welcome to your Futuristic Todo App! 🚀',
-                    'completed': False,
-                    'priority': 'high',
-                    'due_date': next_week_5pm.isoformat(),
-                    'due_time': '17:00',
-                    'created_at': datetime.now().isoformat(),
-                    'notes': 'This is your first mission with date & time! Notice how the due date shows both date and time. You can edit, complete, or delete tasks using the action buttons.'
-                },
-                {
-                    'id': str(uuid.uuid4()),
-                    'text': 'Test the new Date & Time selection feature',
-                    'completed': False,
-                    'priority': 'medium',
-                    'due_date': tomorrow_9am.isoformat(),
-                    'due_time': '09:00',
-                    'created_at': (datetime.now() - timedelta(minutes=1)).isoformat(),
-                    'notes': 'Try adding a new task and notice the improved date/time selection with dropdowns and quick buttons!'
-                },
-                {
-                    'id': str(uuid.uuid4()),
-                    'text': 'Experience the enhanced edit dialog',
-                    'completed': False,
-                    'priority': 'critical',
-                    'due_date': today_eod.isoformat(),
-                    'due_time': '17:30',
-                    'created_at': (datetime.now() - timedelta(minutes=2)).isoformat(),
-                    'notes': 'Click the edit button (✏️) on any task to see the new date/time selection interface with quick-set buttons!'
-                },
-                {
-                    'id': str(uuid.uuid4()),
-                    'text': 'Explore quick date/time buttons',
-                    'completed': True,
-                    'priority': 'low',
-                    'due_date': None,
-                    'created_at': (datetime.now() - timedelta(minutes=3)).isoformat(),
-                    'notes': 'You can use Today, Tomorrow, Next Week buttons for dates and Now, EOD buttons for times.'
-                }
+                Task(
+                    id=self._new_id(),
+                    text='Welcome to your Futuristic Todo App! 🚀',
+                    completed=False,
+                    priority='high',
+                    due_date=next_week_5pm.isoformat(),
+                    due_time='17:00',
+                    created_at=now.isoformat(),
+                    notes='This is your first mission with date & time! Notice how the due date shows both date and time. You can edit, complete, or delete tasks using the action buttons.'
+                ),
+                Task(
+                    id=self._new_id(),
+                    text='Test the new Date & Time selection feature',
+                    completed=False,
+                    priority='medium',
+                    due_date=tomorrow_9am.isoformat(),
+                    due_time='09:00',
+                    created_at=(now - timedelta(minutes=1)).isoformat(),
+                    notes='Try adding a new task and notice the improved date/time selection with dropdowns and quick buttons!'
+                ),
+                Task(
+                    id=self._new_id(),
+                    text='Experience the enhanced edit dialog',
+                    completed=False,
+                    priority='critical',
+                    due_date=today_eod.isoformat(),
+                    due_time='17:30',
+                    created_at=(now - timedelta(minutes=2)).isoformat(),
+                    notes='Click the edit button (✏️) on any task to see the new date/time selection interface with quick-set buttons!'
+                ),
+                Task(
+                    id=self._new_id(),
+                    text='Explore quick date/time buttons',
+                    completed=True,
+                    priority='low',
+                    due_date=None,
+                    created_at=(now - timedelta(minutes=3)).isoformat(),
+                    notes='You can use Today, Tomorrow, Next Week buttons for dates and Now, EOD buttons for times.'
+                )
             ]
             
             self.tasks = welcome_tasks
+            self._rebuild_index()
             self.save_tasks()
             self.render_tasks()
             
@@ -1005,8 +1396,8 @@ class FuturisticTodo:
             )
             
             if filename:
-                with open(filename, 'w') as f:
-                    json.dump(self.tasks, f, indent=2)
+                with open(filename, 'wb') as f:
+                    f.write(_dumps([t.to_dict() for t in self.tasks]))
                 self.show_status(f"Tasks exported to {filename}! 📤", success=True)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export tasks: {str(e)}")
@@ -1020,24 +1411,66 @@ class FuturisticTodo:
             )
             
             if filename:
-                with open(filename, 'r') as f:
-                    imported_tasks = json.load(f)
-                
-                if isinstance(imported_tasks, list):
-                    self.tasks = imported_tasks
+                # Items are validated and staged as they stream in; the merge itself
+                # happens once at the end, followed by a single save/render/update
+                with open(filename, 'rb') as f:
+                    count = self._merge_tasks(_iter_json_array(f))
+                if count:
                     self.save_tasks()
                     self.render_tasks()
                     self.update_stats()
-                    self.show_status(f"Tasks imported from {filename}! 📥", success=True)
+                    self.show_status(f"{count} tasks imported from {filename}! 📥", success=True)
                 else:
                     messagebox.showerror("Error", "Invalid file format!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to import tasks: {str(e)}")
             
+    def _merge_tasks(self, items):
+        """Add imported task dicts on top of the list and return how many were added.
+        Every item is validated before any state is touched, so a bad file merges nothing."""
+        now = datetime.now().isoformat()
+        
+        staged = []
+        for data in items:
+            if not (isinstance(data, dict) and isinstance(data.get('text'), str)
+                    and isinstance(data.get('priority', ''), str)
+                    and isinstance(data.get('notes', ''), str)):
+                raise ValueError("Invalid file format!")
+                
+            values = dict(data)
+            values['id'] = None if data.get('id') is None else str(data['id'])
+            if values.get('created_at') is None:
+                values['created_at'] = now
+            task = Task.from_dict(values)
+            
+            # Mistyped fields or an unparseable created_at raise here; an unparseable
+            # due_date is only tolerated for saved tasks, so reject it explicitly
+            self._precompute_fields(task)
+            if task.due_date and task.due_ts is None:
+                raise ValueError(f"Invalid due date: {task.due_date}")
+            staged.append(task)
+            
+        # Fresh ids for missing or clashing ones, clear of any numeric id in use or in the file
+        next_id = max([self._next_id] + [int(t.id) + 1 for t in staged
+                                         if t.id is not None and t.id.isdecimal()])
+        taken = set(self._by_id)
+        for task in staged:
+            if task.id is None or task.id in taken:
+                task.id = str(next_id)
+                next_id += 1
+            taken.add(task.id)
+            
+        self._next_id = next_id
+        for task in staged:
+            self._index_task(task, precomputed=True)
+        self.tasks = staged + self.tasks
+        return len(staged)
+        
     def clear_all_tasks(self):
         """Clear all tasks"""
         if messagebox.askyesno("Confirm", "Clear all missions? This cannot be undone!"):
             self.tasks = []
+            self._rebuild_index()
             self.save_tasks()
             self.render_tasks()
             self.update_stats()
@@ -1047,18 +1480,25 @@ class FuturisticTodo:
         """Toggle between dark and light themes (placeholder)"""
         self.show_status("Theme toggle feature coming soon! 🌙✨")
         
+    def on_close(self):
+        """Flush any debounced snapshot before the window goes away"""
+        self._flush_snapshot()
+        self.root.destroy()
+        
     def run(self):
         """Start the application"""
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         # Add keyboard shortcuts
         self.root.bind('<Control-n>', lambda e: self.task_var.set("") or None)
-        self.root.bind('<Control-q>', lambda e: self.root.quit())
+        self.root.bind('<Control-q>', lambda e: self.on_close())
         self.root.bind('<F5>', lambda e: (self.load_tasks(), self.render_tasks(), self.update_stats()))
         
         # Start the main loop
         try:
             self.root.mainloop()
         except KeyboardInterrupt:
-            self.root.quit()
+            self.on_close()
 
 def main():
     """Main function to run the application"""
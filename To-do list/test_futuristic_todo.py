@@ -0,0 +1,231 @@
+"""Journal (WAL) replay, import merge and overdue tests for the task store, run without opening a window
+
+Run with: python -m unittest test_futuristic_todo
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+
+import futuristic_todo as ft
+
+
+def put(task_id, text):
+    return {'op': 'put', 'task': ft.Task(id=task_id, text=text).to_dict()}
+
+
+def delete(task_id):
+    return {'op': 'delete', 'id': task_id}
+
+
+class StoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+        # Only the persistence and index state; no Tk widgets are created
+        app = self.app = ft.FuturisticTodo.__new__(ft.FuturisticTodo)
+        app.tasks = []
+        app.current_filter = "all"
+        app.search_query = ""
+        app.data_file = os.path.join(self.tmp.name, "futuristic_todos.json")
+        app.wal_file = os.path.join(self.tmp.name, "futuristic_todos.wal")
+        app._dirty = False
+        app._save_job = None
+        app._next_id = 0
+        app._by_id = {}
+        app._lc_text = {}
+        app._sort_keys = {}
+        app._pending_ids = set()
+        app._completed_ids = set()
+        app._high_ids = set()
+        app._last_due_check = time.time()
+        app._row_pool = []
+        app.render_tasks = lambda: None
+
+    def task_ids(self):
+        return [t.id for t in self.app.tasks]
+
+
+class WalReplayTest(StoreTestCase):
+    def write_snapshot(self, *ids):
+        with open(self.app.data_file, 'w') as f:
+            json.dump([ft.Task(id=task_id, text=f"task {task_id}").to_dict() for task_id in ids], f)
+
+    def write_wal(self, *records):
+        with open(self.app.wal_file, 'w') as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+    def test_put_after_delete_of_same_id_survives(self):
+        self.write_snapshot('0', '1', '2')
+        self.write_wal(delete('2'), put('2', 'reused id'))
+        self.app.load_tasks()
+        self.assertEqual(self.task_ids(), ['2', '0', '1'])
+        self.assertEqual(self.app._by_id['2'].text, 'reused id')
+
+    def test_delete_after_put_removes_task(self):
+        self.write_snapshot('0')
+        self.write_wal(put('1', 'short-lived'), delete('1'))
+        self.app.load_tasks()
+        self.assertEqual(self.task_ids(), ['0'])
+
+    def test_edits_keep_position_and_new_tasks_go_on_top(self):
+        self.write_snapshot('0', '1')
+        self.write_wal(put('2', 'first new'), put('1', 'edited'), put('3', 'second new'))
+        self.app.load_tasks()
+        self.assertEqual(self.task_ids(), ['3', '2', '0', '1'])
+        self.assertEqual(self.app._by_id['1'].text, 'edited')
+
+    def test_replay_is_folded_into_snapshot(self):
+        self.write_snapshot('0', '1', '2')
+        self.write_wal(delete('2'))
+        self.app.load_tasks()
+
+        self.assertFalse(os.path.exists(self.app.wal_file))
+        with open(self.app.data_file) as f:
+            self.assertEqual([t['id'] for t in json.load(f)], ['0', '1'])
+
+        # The deleted id may be reused now that no journal can resurrect or drop it
+        self.assertEqual(self.app._new_id(), '2')
+
+    def test_torn_last_line_is_ignored(self):
+        self.write_snapshot('0')
+        self.write_wal(put('1', 'kept'))
+        with open(self.app.wal_file, 'a') as f:
+            f.write('{"op": "put", "task": {"id": "2"')
+        self.app.load_tasks()
+        self.assertEqual(self.task_ids(), ['1', '0'])
+
+
+class MergeTasksTest(StoreTestCase):
+    def setUp(self):
+        super().setUp()
+        self.app.tasks = [ft.Task(id='0', text='existing'), ft.Task(id='1', text='existing too')]
+        self.app._rebuild_index()
+        self.app._reset_next_id()
+
+    def test_bad_item_merges_nothing(self):
+        items = [{'text': 'fine'}, {'text': 'broken', 'created_at': 12345}]
+        with self.assertRaises(TypeError):
+            self.app._merge_tasks(items)
+        self.assertEqual(self.task_ids(), ['0', '1'])
+        self.assertEqual(set(self.app._by_id), {'0', '1'})
+        self.assertEqual(self.app._pending_ids, {'0', '1'})
+        self.assertEqual(self.app._next_id, 2)
+
+    def test_unparseable_due_date_merges_nothing(self):
+        with self.assertRaises(ValueError):
+            self.app._merge_tasks([{'text': 'fine'}, {'text': 'x', 'due_date': 'garbage'}])
+        self.assertEqual(self.task_ids(), ['0', '1'])
+
+    def test_merged_tasks_are_precomputed_once(self):
+        calls = []
+        precompute = self.app._precompute_fields
+        self.app._precompute_fields = lambda task: (calls.append(task.text), precompute(task))
+        self.app._merge_tasks([{'text': 'x', 'priority': 'high', 'due_date': '2030-01-02T03:04:00'}])
+        self.assertEqual(calls, ['x'])
+        task = self.app.tasks[0]
+        self.assertEqual(task._due_display, "Due: 2030-01-02 at 03:04")
+        self.assertIn(task.id, self.app._high_ids)
+
+    def test_item_without_text_merges_nothing(self):
+        with self.assertRaises(ValueError):
+            self.app._merge_tasks([{'text': 'fine'}, {'notes': 'no text'}])
+        self.assertEqual(self.task_ids(), ['0', '1'])
+
+    def test_null_created_at_is_stamped(self):
+        self.assertEqual(self.app._merge_tasks([{'text': 'x', 'created_at': None}]), 1)
+        self.assertIsInstance(self.app.tasks[0].created_at, str)
+
+    def test_ids_are_normalized_to_strings(self):
+        self.app._merge_tasks([{'id': 1, 'text': 'clashes with existing'}, {'id': 7, 'text': 'kept'}])
+        self.assertEqual(self.task_ids(), ['8', '7', '0', '1'])
+        self.assertTrue(all(isinstance(task_id, str) for task_id in self.app._by_id))
+        self.assertEqual(self.app._new_id(), '9')
+
+    def test_duplicate_ids_within_file_get_fresh_ids(self):
+        self.app._merge_tasks([{'id': 'a', 'text': 'first'}, {'id': 'a', 'text': 'second'}])
+        self.assertEqual(self.task_ids(), ['a', '2', '0', '1'])
+
+    def test_non_ascii_digit_id_survives_reload(self):
+        self.app._merge_tasks([{'id': '²', 'text': 'sup'}])
+        self.app.save_tasks()
+
+        self.app.tasks = []
+        self.app.load_tasks()
+
+        self.assertEqual(self.task_ids(), ['²', '0', '1'])
+        self.assertEqual(set(self.app._by_id), {'²', '0', '1'})
+        self.assertEqual(self.app._new_id(), '2')
+
+    def test_streamed_items_are_consumed_once_and_merged_at_the_end(self):
+        consumed = []
+
+        def stream():
+            for item in ({'text': 'one'}, {'text': 'two'}, {'notes': 'bad'}, {'text': 'never read'}):
+                consumed.append(item)
+                yield item
+
+        with self.assertRaises(ValueError):
+            self.app._merge_tasks(stream())
+        self.assertEqual(len(consumed), 3)
+        self.assertEqual(self.task_ids(), ['0', '1'])
+
+
+class CheckDueTest(StoreTestCase):
+    OVERDUE = "⚠️ 1 mission(s) now overdue!"
+
+    def setUp(self):
+        super().setUp()
+        self.statuses = []
+        self.app.root = type('Root', (), {'after': lambda self, ms, func: None})()
+        self.app._refresh_visible = lambda: None
+        self.app.update_stats = lambda: None
+        self.app.show_status = lambda message, success=False: self.statuses.append(message)
+
+    def due_in(self, **delta):
+        return (datetime.now() + timedelta(**delta)).isoformat()
+
+    def overdue_alerts(self):
+        return [message for message in self.statuses if 'overdue' in message]
+
+    def test_tasks_overdue_at_load_are_not_announced(self):
+        with open(self.app.data_file, 'w') as f:
+            json.dump([ft.Task(id='0', text='late', due_date=self.due_in(hours=-1)).to_dict()], f)
+        self.app.load_tasks()
+        self.app._check_due()
+        self.assertEqual(self.overdue_alerts(), [])
+
+    def test_task_falling_due_between_checks_is_announced_once(self):
+        self.app.load_tasks()
+        self.app._merge_tasks([{'text': 'soon', 'due_date': self.due_in(minutes=-1)}])
+        self.app._last_due_check = time.time() - 120
+        self.app._check_due()
+        self.app._check_due()
+        self.assertEqual(self.overdue_alerts(), [self.OVERDUE])
+
+    def test_imported_overdue_task_is_not_announced(self):
+        self.app.load_tasks()
+        self.app._merge_tasks([{'text': 'ancient', 'due_date': self.due_in(days=-3)}])
+        self.app._check_due()
+        self.assertEqual(self.overdue_alerts(), [])
+
+    def test_reopened_overdue_task_is_not_announced_again(self):
+        self.app.load_tasks()
+        self.app._merge_tasks([{'id': '0', 'text': 'late', 'due_date': self.due_in(minutes=-1)}])
+        self.app._last_due_check = time.time() - 120
+        self.app._check_due()
+
+        self.app.toggle_task('0')
+        self.app._check_due()
+        self.app.toggle_task('0')
+        self.app._check_due()
+        self.assertEqual(self.overdue_alerts(), [self.OVERDUE])
+
+
+if __name__ == '__main__':
+    unittest.main()